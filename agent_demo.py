@@ -3,22 +3,28 @@ Simple function-calling agent that answers questions about 천간·지지 traits
 
 Usage:
   1) Set OPENAI_API_KEY in your environment.
-  2) Run: `python agent_demo.py`
+  2) Run: `python agent_demo.py`, or `python agent_demo.py --chat` for a multi-turn session.
 """
 
 import json
-from typing import Callable, Dict, List
+import sys
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from tools import TOOL_REGISTRY, load_tool_specs
+from session_store import SessionStore, response_usage
+from tools import TOOL_REGISTRY, compile_tool_specs
+from tools.tracing import begin_trace, now_us, span, trace, use_trace
 
 client = OpenAI()
+# Used by the streaming server path so a request never parks a worker thread on I/O.
+async_client = AsyncOpenAI()
+SESSIONS = SessionStore()
 
 
 def load_tools(tools_path: str = "tools.json") -> List[Dict]:
     """Load the tool schema (supports $include for per-tool spec files)."""
-    return load_tool_specs(tools_path)
+    return compile_tool_specs(tools_path).openai_tools
 
 
 TOOLS: List[Dict] = load_tools()
@@ -33,52 +39,180 @@ def handle_tool_call(tool_name: str, raw_arguments: str) -> Dict:
     return fn(**args)
 
 
-def run_agent(question: str, model: str = "gpt-4o-mini") -> str:
-    """One-turn agent run: ask, let the model call tools, and return the final answer text."""
-    messages = [
-        {
-            "role": "system",
-            "content": "너는 사주 초보자를 돕는 도우미다. 필요하면 제공된 함수로 천간/지지 정보를 조회해라.",
-        },
+# Tool-calling rounds run_agent allows before the model has to answer.
+MAX_TOOL_ROUNDS = 5
+
+SYSTEM_PROMPT = "너는 사주 초보자를 돕는 도우미다. 필요하면 제공된 함수로 천간/지지 정보를 조회해라."
+
+
+def _initial_messages(question: str) -> List[Dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user", "content": question},
     ]
 
-    first = client.chat.completions.create(
-        model=model,
-        messages=messages,
-        tools=TOOLS,
-        tool_choice="auto",
-    )
-
-    message = first.choices[0].message
-    print("=== First response ===")
-    print(message)
-    messages.append(message)
-
-    if not message.tool_calls:
-        return message.content or ""
-
-    # Execute each tool call and append results so the model can cite them.
-    for tool_call in message.tool_calls:
-        tool_result = handle_tool_call(tool_call.function.name, tool_call.function.arguments)
-        messages.append(
+
+def _tool_messages(tool_calls) -> List[Dict]:
+    """Execute each tool call and wrap the results so the model can cite them."""
+    results = []
+    for tool_call in tool_calls:
+        with span(f"tool.{tool_call.function.name}", category="tool"):
+            tool_result = handle_tool_call(tool_call.function.name, tool_call.function.arguments)
+        with span("serialize.json_dumps", category="serialize", tool=tool_call.function.name):
+            content = json.dumps(tool_result, ensure_ascii=False, indent=2)
+        results.append(
             {
                 "role": "tool",
                 "tool_call_id": tool_call.id,
                 "name": tool_call.function.name,
-                "content": json.dumps(tool_result, ensure_ascii=False, indent=2),
+                "content": content,
             }
         )
-
-    second = client.chat.completions.create(
-        model=model,
-        messages=messages,
-    )
-
-    return second.choices[0].message.content or ""
+    return results
+
+
+@trace("agent.run_agent")
+def run_agent(question: str, model: str = "gpt-4o-mini", tools: Optional[List[Dict]] = None) -> str:
+    """One-turn agent run: ask, let the model call tools, and return the final answer text.
+
+    The model may call tools over several rounds; after MAX_TOOL_ROUNDS it must answer.
+    ``tools`` overrides the offered tool specs (default: every tool in tools.json).
+    """
+    messages = _initial_messages(question)
+
+    for round_index in range(MAX_TOOL_ROUNDS + 1):
+        with span("llm.chat_completion", category="llm", call=round_index):
+            response = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                tools=TOOLS if tools is None else tools,
+                tool_choice="auto" if round_index < MAX_TOOL_ROUNDS else "none",
+            )
+
+        message = response.choices[0].message
+        if round_index == 0:
+            print("=== First response ===")
+            print(message)
+        if not message.tool_calls:
+            return message.content or ""
+
+        messages.append(message)
+        messages.extend(_tool_messages(message.tool_calls))
+    return ""
+
+
+async def stream_agent(question: str, model: str = "gpt-4o-mini") -> AsyncIterator[str]:
+    """Same flow as run_agent on the async client, yielding the final answer as it is generated.
+
+    The trace is activated only around non-yielding blocks, so it never leaks into the
+    caller's context between chunks.
+    """
+    active = begin_trace("agent.stream_agent")
+    try:
+        with use_trace(active):
+            messages = _initial_messages(question)
+            with span("llm.chat_completion", category="llm", call="first"):
+                first = await async_client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    tools=TOOLS,
+                    tool_choice="auto",
+                )
+            message = first.choices[0].message
+            messages.append(message)
+            if message.tool_calls:
+                # Tool calls are in-memory lookups, cheap enough to run on the event loop.
+                messages.extend(_tool_messages(message.tool_calls))
+
+        if not message.tool_calls:
+            yield message.content or ""
+            return
+
+        start = now_us()
+        first_chunk = None
+        stream = await async_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                if first_chunk is None:
+                    first_chunk = now_us()
+                yield chunk.choices[0].delta.content
+        if active is not None:
+            if first_chunk is not None:
+                active.add("llm.time_to_first_chunk", "llm", start, first_chunk, {"call": "second"})
+            active.add("llm.chat_completion", "llm", start, now_us(), {"call": "second", "stream": True})
+    finally:
+        if active is not None:
+            active.finish()
+
+
+@trace("agent.chat")
+def chat(session_id: str, question: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
+    """One turn of a multi-turn session; returns the answer and prompt-cache usage.
+
+    Both completions send the same tools and system prompt first, so that prefix is
+    byte-identical across calls and turns and can be served from the provider cache.
+    """
+    session = SESSIONS.get(session_id)
+    with session.lock:
+        messages = session.messages(SYSTEM_PROMPT, question)
+        prompt_tokens = cached_tokens = 0
+
+        with span("llm.chat_completion", category="llm", call="first"):
+            first = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                tools=TOOLS,
+                tool_choice="auto",
+            )
+        prompt, cached = response_usage(first)
+        prompt_tokens += prompt
+        cached_tokens += cached
+
+        message = first.choices[0].message
+        answer = message.content or ""
+        if message.tool_calls:
+            messages.append(message)
+            messages.extend(_tool_messages(message.tool_calls))
+            with span("llm.chat_completion", category="llm", call="second"):
+                second = client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    tools=TOOLS,
+                    tool_choice="none",
+                )
+            prompt, cached = response_usage(second)
+            prompt_tokens += prompt
+            cached_tokens += cached
+            answer = second.choices[0].message.content or ""
+
+        SESSIONS.record_turn(session, question, answer)
+        session.prompt_tokens += prompt_tokens
+        session.cached_tokens += cached_tokens
+    return {
+        "session_id": session_id,
+        "answer": answer,
+        "usage": {"prompt_tokens": prompt_tokens, "cached_prompt_tokens": cached_tokens},
+    }
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--chat":
+        while True:
+            try:
+                line = input("> ").strip()
+            except EOFError:
+                break
+            if not line:
+                continue
+            reply = chat("cli", line)
+            print(reply["answer"])
+            print(f"[prompt tokens {reply['usage']['prompt_tokens']}, cached {reply['usage']['cached_prompt_tokens']}]")
+        sys.exit(0)
+
     question = "卯는 어떤 성격인가요?"
     answer = run_agent(question)
     print(answer)
@@ -11,9 +11,10 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
 import signal
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional
 
 # CrewAI accesses several POSIX-only signals; stub them on Windows.
 if not hasattr(signal, "SIGHUP"):
@@ -23,17 +24,18 @@ if not hasattr(signal, "SIGTSTP"):
 if not hasattr(signal, "SIGCONT"):
     signal.SIGCONT = signal.SIGTERM  # type: ignore[attr-defined]
 
-from pydantic import BaseModel, create_model, field_validator
+from pydantic import BaseModel, PrivateAttr, field_validator
 
-from crewai import Agent, Crew, Process, Task
+from crewai import LLM, Agent, Crew, Process, Task
 from crewai.tools import BaseTool
 
-from tools import TOOL_REGISTRY, get_ganji_traits, load_tool_specs
+from tools import TOOL_REGISTRY, compile_tool_specs, get_ganji_traits
 from tools.common import BRANCHES, ELEMENTS, STEMS
+from tools.tracing import Trace, current_trace, span, trace, use_trace
 
 
-# Load all specs once so we can derive names and a representative example.
-ALL_TOOL_SPECS = load_tool_specs("tools.json")
+# Specs are compiled once and cached; later lookups reuse the same bundle.
+ALL_TOOL_SPECS = compile_tool_specs("tools.json").openai_tools
 TOOL_SPEC = ALL_TOOL_SPECS[0]["function"]
 TOOL_NAMES = [spec["function"]["name"] for spec in ALL_TOOL_SPECS]
 TOOL_DESCRIPTION = TOOL_SPEC.get("description", "천간/지지 코드의 특성을 조회합니다.")
@@ -43,7 +45,8 @@ TOOL_USAGE_GUIDE = (
     "사용 가능한 도구: "
     f"{', '.join(TOOL_NAMES)}. "
     "필요에 맞는 도구를 선택해 스펙에 정의된 파라미터로 호출하라 "
-    f"(예시: {TOOL_SPEC.get('name', 'get_ganji_traits')}(kind: 'stem'|'branch', code: [{CODE_LIST_TEXT}]))."
+    f"(예시: {TOOL_SPEC.get('name', 'get_ganji_traits')}(kind: 'stem'|'branch', code: [{CODE_LIST_TEXT}])). "
+    "한 글자에 대한 종합 질문은 get_branch_full_profile/get_stem_full_profile/get_element_full_profile로 한 번에 조회하라."
 )
 
 
@@ -66,47 +69,54 @@ class GanjiArgs(BaseModel):
         return v
 
 
-class GanjiTool(BaseTool):
+class TracedLLM(LLM):
+    """LLM whose calls are recorded as llm.chat_completion spans.
+
+    Inside crew.kickoff this separates model wait from CrewAI's own overhead. The
+    trace is passed in explicitly: CrewAI may call the LLM from a worker thread,
+    where the context variable holding the current trace is not set.
+    """
+
+    def __init__(self, *args: Any, active_trace: Optional[Trace] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.active_trace = active_trace
+
+    def call(self, *args: Any, **kwargs: Any) -> Any:
+        with use_trace(self.active_trace), span("llm.chat_completion", category="llm", model=self.model):
+            return super().call(*args, **kwargs)
+
+
+class TracedTool(BaseTool):
+    """BaseTool whose runs are recorded as tool.<name> spans in the crew run's trace."""
+
+    _trace: Optional[Trace] = PrivateAttr(default=None)
+
+    @contextlib.contextmanager
+    def _tool_span(self) -> Iterator[None]:
+        # Bound explicitly for the same reason as TracedLLM: tools may run on another thread.
+        with use_trace(self._trace), span(f"tool.{self.name}", category="tool"):
+            yield
+
+
+class GanjiTool(TracedTool):
     name: str = "get_ganji_traits"
     description: str = TOOL_DESCRIPTION
     args_schema: type[BaseModel] = GanjiArgs
 
     def _run(self, kind: str, code: str) -> dict:
-        return get_ganji_traits(kind, code)
-
-
-def _pydantic_field(property_spec: Dict[str, Any], required: bool) -> Tuple[type, Any]:
-    """Create a pydantic field tuple from an OpenAPI-style property spec."""
-    t = str
-    if property_spec.get("type") in {"integer", "number"}:
-        t = int
-    enum = property_spec.get("enum")
-    if enum:
-        try:
-            from typing import Literal
-
-            t = Literal[tuple(enum)]  # type: ignore[assignment]
-        except Exception:
-            t = str
-    default = ... if required else None
-    return t, default
+        with self._tool_span():
+            return get_ganji_traits(kind, code)
 
 
 def build_dynamic_tool(spec: Dict[str, Any]) -> BaseTool:
     """Build a CrewAI BaseTool from a tool spec and registry function."""
     tool_name = spec["name"]
     func = TOOL_REGISTRY[tool_name]
-    params = spec.get("parameters", {}).get("properties", {})
-    required_fields = set(spec.get("parameters", {}).get("required", []))
-
-    model_fields = {
-        field_name: _pydantic_field(prop_spec, field_name in required_fields)
-        for field_name, prop_spec in params.items()
-    }
-    args_model = create_model(f"{tool_name}_Args", **model_fields)  # type: ignore[arg-type]
+    args_model = compile_tool_specs("tools.json").crewai_args_models[tool_name]
 
     def _run(self, **kwargs: Any) -> Any:  # type: ignore[override]
-        return func(**kwargs)
+        with self._tool_span():
+            return func(**kwargs)
 
     annotations = {
         "name": str,
@@ -121,25 +131,27 @@ def build_dynamic_tool(spec: Dict[str, Any]) -> BaseTool:
         "args_schema": args_model,
         "_run": _run,
     }
-    DynamicTool = type(f"{tool_name}_Tool", (BaseTool,), attrs)
+    DynamicTool = type(f"{tool_name}_Tool", (TracedTool,), attrs)
     return DynamicTool()
 
 
-def build_tools() -> List[BaseTool]:
-    """Instantiate tools for all functions defined in tools.json."""
-    specs = load_tool_specs("tools.json")
+def build_tools(active_trace: Optional[Trace] = None) -> List[BaseTool]:
+    """Instantiate tools for all functions defined in tools.json, recording into ``active_trace``."""
+    specs = compile_tool_specs("tools.json").openai_tools
     tools: List[BaseTool] = []
     for spec_entry in specs:
         function_spec = spec_entry["function"]
         tools.append(build_dynamic_tool(function_spec))
     # Keep ganji tool (with stricter validation) first for backward compatibility
     tools.insert(0, GanjiTool())
+    for tool in tools:
+        tool._trace = active_trace
     return tools
 
 
-def build_crew(model: str = "gpt-4o-mini") -> Crew:
+def build_crew(model: str = "gpt-4o-mini", active_trace: Optional[Trace] = None) -> Crew:
     """Create the Crew with a single helper agent and one answering task."""
-    tools = build_tools()
+    tools = build_tools(active_trace)
 
     helper = Agent(
         role="사주 도우미",
@@ -148,7 +160,7 @@ def build_crew(model: str = "gpt-4o-mini") -> Crew:
         tools=tools,
         allow_delegation=False,
         verbose=False,
-        model=model,
+        llm=TracedLLM(model=model, active_trace=active_trace),
     )
 
     answer_task = Task(
@@ -170,11 +182,19 @@ def build_crew(model: str = "gpt-4o-mini") -> Crew:
     )
 
 
+@trace("crew.run")
 def run(question: str, model: str = "gpt-4o-mini") -> str:
-    """Run the crew on a single question and return the answer text."""
-    crew = build_crew(model=model)
-    result = crew.kickoff(inputs={"question": question})
-    return str(result)
+    """Run the crew on a single question and return the answer text.
+
+    Inside the crew.kickoff span, llm.chat_completion and tool.* spans cover model
+    wait and tool time; the rest of kickoff is CrewAI's own overhead.
+    """
+    with span("crew.build", category="crewai"):
+        crew = build_crew(model=model, active_trace=current_trace())
+    with span("crew.kickoff", category="crewai"):
+        result = crew.kickoff(inputs={"question": question})
+    with span("serialize.result", category="serialize"):
+        return str(result)
 
 
 def _sample_inputs() -> Dict[str, Dict[str, Any]]:
@@ -190,13 +210,18 @@ def _sample_inputs() -> Dict[str, Dict[str, Any]]:
         "get_five_element_relation": {"source": ELEMENTS[0], "target": ELEMENTS[1]},
         "get_hidden_stems": {"branch": BRANCHES[0]},
         "get_stem_purpose": {"stem": STEMS[0]},
+        "search_knowledge": {"query": "리더십"},
+        "get_branch_full_profile": {"branch": BRANCHES[0]},
+        "get_stem_full_profile": {"stem": STEMS[0]},
+        "get_element_full_profile": {"element": ELEMENTS[0]},
+        "get_chart_balance": {"year_pillar": "甲子", "month_pillar": "丙寅", "day_pillar": "戊辰", "hour_pillar": "庚申"},
     }
 
 
 def smoke_test() -> None:
     """Call every tool once with representative inputs and print results."""
     samples = _sample_inputs()
-    specs = {spec["function"]["name"]: spec["function"] for spec in load_tool_specs("tools.json")}
+    specs = compile_tool_specs("tools.json").function_specs
     for name, func in TOOL_REGISTRY.items():
         if name not in samples:
             continue
@@ -212,7 +237,7 @@ def smoke_test() -> None:
 def test_all_tools_sequential() -> None:
     """Run all tools in tools.json order with sample inputs."""
     samples = _sample_inputs()
-    specs = load_tool_specs("tools.json")
+    specs = compile_tool_specs("tools.json").openai_tools
     for spec_entry in specs:
         func_spec = spec_entry["function"]
         name = func_spec["name"]
@@ -0,0 +1,99 @@
+"""
+Measure tool-calling rounds per question for the function-calling agent, with and
+without the composite full_profile tools offered.
+
+Every question is replayed through agent_demo.run_agent, which keeps calling tools
+until the model answers, once with all tools from tools.json and once without
+get_branch_full_profile / get_stem_full_profile / get_element_full_profile. Rounds
+(completions that requested tools), tool calls and completions are counted from the
+agent's own trace spans and averaged over --runs repetitions.
+
+Usage (the measurement: a real model, needs OPENAI_API_KEY):
+  python measure_tool_rounds.py --model gpt-4o-mini --runs 3
+
+Plumbing check only, against saju_front.stub_model. The stub's tool choice is
+scripted, so its numbers exercise this script and say nothing about rounds saved:
+  python -m saju_front.stub_model --port 8001 --latency-ms 0
+  OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=stub python measure_tool_rounds.py --runs 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import time
+from typing import Dict, List, Optional, Sequence
+
+import agent_demo
+from tools.tracing import trace
+
+COMPOSITE_TOOLS = {"get_branch_full_profile", "get_stem_full_profile", "get_element_full_profile"}
+QUESTIONS: List[str] = [
+    "寅는 어떤 지지인가?",
+    "子의 성격과 계절을 알려줘",
+    "甲목 일간을 자세히 알려줘",
+    "庚금 일간은 어떤 사람인가?",
+    "木 기운은 어떤 의미인가?",
+    "水 기운이 강하면 어떤가?",
+]
+METRICS = ("rounds", "tool_calls", "completions", "ms")
+
+
+def measure(question: str, model: str, tools: List[Dict]) -> Dict[str, float]:
+    """Run one question and return its tool rounds, tool calls, completions and wall time."""
+    start = time.perf_counter()
+    # run_agent prints the raw first response; keep the report readable.
+    with trace("measure.tool_rounds", sample_rate=1.0, export=False) as active, contextlib.redirect_stdout(
+        io.StringIO()
+    ):
+        agent_demo.run_agent(question, model=model, tools=tools)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    completions = sum(1 for event in active.events if event["name"] == "llm.chat_completion")
+    return {
+        # Every completion but the final answer asked for tools.
+        "rounds": completions - 1,
+        "tool_calls": sum(1 for event in active.events if event["cat"] == "tool"),
+        "completions": completions,
+        "ms": elapsed_ms,
+    }
+
+
+def _format(result: Dict[str, float]) -> str:
+    return (
+        f"{result['rounds']:.1f} rounds / {result['tool_calls']:.1f} calls / "
+        f"{result['completions']:.1f} completions / {result['ms']:.0f}ms"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--runs", type=int, default=3, help="repetitions per question and variant")
+    args = parser.parse_args(argv)
+
+    variants = {
+        "primitives only": [t for t in agent_demo.TOOLS if t["function"]["name"] not in COMPOSITE_TOOLS],
+        "with composites": agent_demo.TOOLS,
+    }
+    print(f"model {args.model} at {agent_demo.client.base_url}, {args.runs} run(s) per question")
+    totals = {label: dict.fromkeys(METRICS, 0.0) for label in variants}
+    for question in QUESTIONS:
+        cells = []
+        for label, tools in variants.items():
+            sums = dict.fromkeys(METRICS, 0.0)
+            for _ in range(args.runs):
+                for key, value in measure(question, args.model, tools).items():
+                    sums[key] += value
+            for key in METRICS:
+                totals[label][key] += sums[key]
+            cells.append(_format({key: value / args.runs for key, value in sums.items()}))
+        print(f"{question}: {' -> '.join(cells)}")
+
+    samples = len(QUESTIONS) * args.runs
+    for label, total in totals.items():
+        print(f"{label}: avg {_format({key: value / samples for key, value in total.items()})} per question")
+
+
+if __name__ == "__main__":
+    main()
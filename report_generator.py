@@ -0,0 +1,307 @@
+"""
+Deterministic bulk report generator for full chart readings (no agent round trips).
+
+Input files are JSONL (one chart per line) or CSV with the columns
+id, year, month, day, hour (hour may be empty), e.g.
+  {"id": "u-001", "year": "甲子", "month": "丙寅", "day": "戊辰", "hour": "庚申"}
+
+Usage:
+  python report_generator.py charts.jsonl --format markdown -o reports.md
+  python report_generator.py a.jsonl b.csv --format json --workers 8 --chunk-size 200 -o reports.jsonl
+  python report_generator.py charts.jsonl --polish-model gpt-4o-mini   # optional LLM polish of Markdown (needs OPENAI_API_KEY)
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import functools
+import itertools
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from tools import (
+    get_branch_full_profile,
+    get_branch_interaction,
+    get_chart_balance,
+    get_element_interpretation_contextual,
+    get_stem_full_profile,
+)
+from tools.element_scoring import parse_pillar
+
+PILLAR_NAMES: Dict[str, str] = {"year": "연주", "month": "월주", "day": "일주", "hour": "시주"}
+READING_CONTEXTS: List[str] = ["career", "relationship", "health"]
+CONTEXT_NAMES: Dict[str, str] = {"career": "직업", "relationship": "인간관계", "health": "건강"}
+# Set by iter_charts on rows that could not be parsed; render_chart reports them as errors.
+INPUT_ERROR_KEY = "_input_error"
+POLISH_PROMPT = "다음 사주 리포트의 사실과 구조는 그대로 두고, 초보자가 읽기 쉬운 자연스러운 한국어로 다듬어라."
+
+# Templates are parsed once at import; per-stem/branch sections are rendered once and cached.
+REPORT_TEMPLATE = Template(
+    "# 사주 리포트: $chart_id\n\n"
+    "## 원국\n$pillars\n\n"
+    "## 오행 균형\n"
+    "- 일간: $day_stem ($day_element), $strength (비겁·인성 비율 $support_ratio)\n"
+    "- 오행 점수: $scores\n"
+    "- 과다: $excess / 부족: $missing\n"
+    "- 보완 추천: $recommended / 주의: $avoid\n\n"
+    "## 천간\n$stem_sections\n\n"
+    "## 지지\n$branch_sections\n\n"
+    "## 지지 관계\n$interactions\n\n"
+    "## 일간 오행 해석\n$interpretations\n"
+)
+STEM_TEMPLATE = Template("### $stem ($element, $yinyang)\n$traits\n- 용도: $purpose")
+BRANCH_TEMPLATE = Template("### $branch ($element, $yinyang, $season)\n$traits\n- 지장간: $hidden")
+ERROR_TEMPLATE = Template("# 사주 리포트: $chart_id\n\n오류: $error\n")
+
+
+def _join(values: Iterable[str]) -> str:
+    return ", ".join(values) or "없음"
+
+
+def _bullets(items: Dict[str, str]) -> str:
+    return "\n".join(f"- {key}: {value}" for key, value in items.items())
+
+
+@functools.lru_cache(maxsize=None)
+def _stem_section(stem: str) -> str:
+    profile = get_stem_full_profile(stem)
+    return STEM_TEMPLATE.substitute(
+        stem=stem,
+        element=profile["element"],
+        yinyang=profile["yinyang"],
+        traits=_bullets(profile["traits"]),
+        purpose=profile["purpose"],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _branch_section(branch: str) -> str:
+    profile = get_branch_full_profile(branch)
+    return BRANCH_TEMPLATE.substitute(
+        branch=branch,
+        element=profile["element"],
+        yinyang=profile["yinyang"],
+        season=profile["season"],
+        traits=_bullets(profile["traits"]),
+        hidden=_join(item["stem"] for item in profile["hidden_stems"]),
+    )
+
+
+def build_report(chart: Dict[str, Any]) -> Dict[str, Any]:
+    """Compose the full reading for one chart from the tool functions."""
+    chart_id = str(chart.get("id", ""))
+    pillars = {position: chart.get(position) for position in PILLAR_NAMES if chart.get(position)}
+    for position in ("year", "month", "day"):
+        if position not in pillars:
+            raise ValueError(f"{position} pillar is required")
+    for position, value in pillars.items():
+        if not isinstance(value, str):
+            raise ValueError(f"{position} pillar must be a string such as '甲子'")
+    balance = get_chart_balance(
+        year_pillar=pillars["year"],
+        month_pillar=pillars["month"],
+        day_pillar=pillars["day"],
+        hour_pillar=pillars.get("hour"),
+    )
+    parsed = {position: parse_pillar(value) for position, value in pillars.items()}
+    stems = list(dict.fromkeys(stem for stem, _ in parsed.values()))
+    branches = list(dict.fromkeys(branch for _, branch in parsed.values()))
+
+    interactions = []
+    positions = list(parsed)
+    for first, second in itertools.combinations(positions, 2):
+        result = get_branch_interaction(parsed[first][1], parsed[second][1])
+        if result["relation"] not in {"none", "same"}:
+            interactions.append({"positions": [first, second], **result})
+
+    interpretations = {
+        context: get_element_interpretation_contextual(balance["day_stem"], context)["interpretation"]
+        for context in READING_CONTEXTS
+    }
+    return {
+        "id": chart_id,
+        "pillars": pillars,
+        "balance": balance,
+        "stems": stems,
+        "branches": branches,
+        "interactions": interactions,
+        "interpretations": interpretations,
+    }
+
+
+def _interaction_line(item: Dict[str, Any]) -> str:
+    first, second = (PILLAR_NAMES[position] for position in item["positions"])
+    return f"- {first}·{second} {''.join(item['pair'])}: {item['relation']}"
+
+
+def render_markdown(report: Dict[str, Any]) -> str:
+    if "error" in report:
+        return ERROR_TEMPLATE.substitute(chart_id=report["id"], error=report["error"])
+    balance = report["balance"]
+    return REPORT_TEMPLATE.substitute(
+        chart_id=report["id"],
+        pillars="\n".join(f"- {PILLAR_NAMES[pos]}: {value}" for pos, value in report["pillars"].items()),
+        day_stem=balance["day_stem"],
+        day_element=balance["day_element"],
+        strength=balance["strength"],
+        support_ratio=balance["support_ratio"],
+        scores=", ".join(f"{element} {score}" for element, score in balance["scores"].items()),
+        excess=_join(balance["excess"]),
+        missing=_join(balance["missing"]),
+        recommended=_join(balance["recommended_elements"]),
+        avoid=_join(balance["avoid_elements"]),
+        stem_sections="\n\n".join(_stem_section(stem) for stem in report["stems"]),
+        branch_sections="\n\n".join(_branch_section(branch) for branch in report["branches"]),
+        interactions="\n".join(_interaction_line(item) for item in report["interactions"])
+        or "- 특별한 합·충·형·파·해 없음",
+        interpretations="\n".join(
+            f"- {CONTEXT_NAMES[context]}: {text}" for context, text in report["interpretations"].items()
+        ),
+    )
+
+
+def render_json(report: Dict[str, Any]) -> str:
+    return json.dumps(report, ensure_ascii=False, separators=(",", ":"))
+
+
+RENDERERS = {"markdown": render_markdown, "json": render_json}
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_client():
+    from openai import OpenAI
+
+    return OpenAI()
+
+
+def polish(text: str, model: str) -> str:
+    """Optionally rewrite a rendered report with an LLM; facts stay as rendered."""
+    response = _openai_client().chat.completions.create(
+        model=model,
+        messages=[{"role": "system", "content": POLISH_PROMPT}, {"role": "user", "content": text}],
+    )
+    return response.choices[0].message.content or text
+
+
+def render_chart(chart: Dict[str, Any], fmt: str = "markdown", polish_model: Optional[str] = None) -> str:
+    """Build and render one report; invalid charts render as an error entry instead of raising."""
+    if not isinstance(chart, dict):
+        report: Dict[str, Any] = {"id": "", "error": f"chart must be an object, got {type(chart).__name__}"}
+    elif INPUT_ERROR_KEY in chart:
+        report = {"id": str(chart.get("id", "")), "error": chart[INPUT_ERROR_KEY]}
+    else:
+        try:
+            report = build_report(chart)
+        except Exception as exc:  # one bad row must not abort a bulk run
+            report = {"id": str(chart.get("id", "")), "error": f"{type(exc).__name__}: {exc}"}
+    text = RENDERERS[fmt](report)
+    if polish_model and fmt == "markdown" and "error" not in report:
+        try:
+            text = polish(text, polish_model)
+        except Exception as exc:  # keep the deterministic report if the LLM call fails
+            print(f"polish failed for {report['id']}: {exc}", file=sys.stderr)
+    return text
+
+
+def _render_chunk(charts: List[Dict[str, Any]], fmt: str, polish_model: Optional[str]) -> List[str]:
+    return [render_chart(chart, fmt, polish_model) for chart in charts]
+
+
+def iter_charts(paths: Sequence[str | Path]) -> Iterator[Dict[str, Any]]:
+    """Stream charts from JSONL or CSV files one at a time."""
+    for path in map(Path, paths):
+        with path.open(encoding="utf-8", newline="") as handle:
+            if path.suffix.lower() == ".csv":
+                yield from csv.DictReader(handle)
+                continue
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    # Surface the bad line as an error entry instead of ending the run.
+                    yield {"id": f"{path}:{line_number}", INPUT_ERROR_KEY: f"invalid JSON: {exc.msg}"}
+
+
+def _chunks(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def generate_reports(
+    charts: Iterable[Dict[str, Any]],
+    fmt: str = "markdown",
+    workers: int = 1,
+    chunk_size: int = 100,
+    polish_model: Optional[str] = None,
+) -> Iterator[str]:
+    """Yield rendered reports in input order.
+
+    With workers > 1, chunks are rendered in a process pool. At most two chunks per
+    worker are in flight, so memory stays constant however large the input is.
+    """
+    if fmt not in RENDERERS:
+        raise ValueError(f"format must be one of {sorted(RENDERERS)}")
+    if polish_model and fmt != "markdown":
+        raise ValueError("polishing applies to markdown reports only")
+    if workers <= 1:
+        for chart in charts:
+            yield render_chart(chart, fmt, polish_model)
+        return
+
+    pending: "deque[Future[List[str]]]" = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in _chunks(charts, chunk_size):
+            pending.append(pool.submit(_render_chunk, chunk, fmt, polish_model))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", help="JSONL or CSV chart files")
+    parser.add_argument("--format", choices=sorted(RENDERERS), default="markdown")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--polish-model", help="LLM model used to polish Markdown reports (markdown format only)")
+    args = parser.parse_args(argv)
+    if args.polish_model and args.format != "markdown":
+        parser.error("--polish-model only applies to --format markdown")
+
+    separator = "\n---\n\n" if args.format == "markdown" else "\n"
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    start = time.perf_counter()
+    try:
+        reports = generate_reports(
+            iter_charts(args.inputs),
+            fmt=args.format,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            polish_model=args.polish_model,
+        )
+        for text in reports:
+            out.write(text + separator)
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0.0
+    print(f"{count} reports in {elapsed:.2f}s ({rate:.1f} reports/sec)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
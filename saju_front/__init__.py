@@ -0,0 +1,17 @@
+"""
+HTTP front end for the saju tools and agent.
+
+Prerequisites:
+  pip install starlette uvicorn gunicorn httpx openai pyyaml
+Usage:
+  gunicorn -c saju_front/gunicorn.conf.py saju_front.app:app       # production (multi-worker, preloaded)
+  uvicorn saju_front.app:app --port 8000                           # local development
+  python -m saju_front.stub_model --port 8001                      # OpenAI-compatible stub model
+  python -m saju_front.loadtest --url http://127.0.0.1:8000        # load test
+
+Endpoints:
+  GET  /tools                 tool specs (OpenAI tools format)
+  POST /tools/<tool_name>     JSON object of tool arguments -> tool result
+  POST /batch                 {"calls": [{"tool": ..., "arguments": {...}}]} -> {"results": [...]}
+  POST /agent                 {"question": ..., "model": ...} -> streamed answer text
+"""
@@ -0,0 +1,191 @@
+"""ASGI app exposing every registered tool, a batch endpoint and a streaming agent endpoint."""
+
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from tools import (
+    TOOL_REGISTRY,
+    get_branch_full_profile,
+    get_element_full_profile,
+    get_ganji_traits,
+    get_stem_full_profile,
+    load_tool_specs,
+    search_knowledge,
+)
+from tools.common import BRANCHES, ELEMENTS, STEMS
+from tools.data_loader import TOOLS_DIR, load_yaml_resource
+
+JSON_MEDIA_TYPE = "application/json"
+MAX_BATCH_CALLS = 64
+SERIALIZED_CACHE_SIZE = 4096
+
+ArgsKey = Tuple[Tuple[str, Any], ...]
+
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _call_tool(name: str, args: Dict[str, Any]) -> Tuple[int, bytes]:
+    """Run one tool and return (status, serialized body); bad input is serialized as a 400.
+
+    Unexpected errors propagate so they are never cached; tool_response_bytes turns
+    them into a 500 entry.
+    """
+    fn: Callable | None = TOOL_REGISTRY.get(name)
+    if not fn:
+        return 404, _dumps({"error": f"Unknown tool: {name}"})
+    try:
+        return 200, _dumps(fn(**args))
+    except (TypeError, ValueError, AttributeError) as exc:
+        # Wrong argument names or types, e.g. a number where a string code is expected.
+        return 400, _dumps({"error": str(exc)})
+
+
+@functools.lru_cache(maxsize=SERIALIZED_CACHE_SIZE)
+def _cached_tool_bytes(name: str, args_key: ArgsKey) -> Tuple[int, bytes]:
+    """Tools are pure lookups, so the serialized body for a given call never changes."""
+    return _call_tool(name, dict(args_key))
+
+
+def tool_response_bytes(name: str, args: Dict[str, Any]) -> Tuple[int, bytes]:
+    """Return the serialized response for a tool call, reusing earlier serializations.
+
+    Never raises: each call, including each batch entry, fails on its own.
+    """
+    try:
+        try:
+            args_key = tuple(sorted(args.items()))
+            hash(args_key)
+        except TypeError:
+            # Lists/objects in arguments are not cacheable; serialize on the fly.
+            return _call_tool(name, args)
+        return _cached_tool_bytes(name, args_key)
+    except Exception as exc:
+        return 500, _dumps({"error": f"{type(exc).__name__}: {exc}"})
+
+
+def warm_up() -> None:
+    """Load every resource and pre-serialize the enumerable responses.
+
+    Run at import so that, with a preloading server (gunicorn ``preload_app``),
+    workers fork with the data already in memory.
+    """
+    for path in sorted(TOOLS_DIR.glob("*/*.yaml")):
+        load_yaml_resource(str(path.relative_to(TOOLS_DIR)))
+    get_ganji_traits("stem", STEMS[0])
+    search_knowledge(ELEMENTS[0])
+    for branch in BRANCHES:
+        tool_response_bytes(get_branch_full_profile.__name__, {"branch": branch})
+    for stem in STEMS:
+        tool_response_bytes(get_stem_full_profile.__name__, {"stem": stem})
+    for element in ELEMENTS:
+        tool_response_bytes(get_element_full_profile.__name__, {"element": element})
+
+
+TOOL_SPECS_BYTES = _dumps(load_tool_specs(TOOLS_DIR.parent / "tools.json"))
+warm_up()
+
+
+async def _json_body(request: Request) -> Any:
+    raw = await request.body()
+    if not raw:
+        return {}
+    return json.loads(raw)
+
+
+def _bad_request(message: str) -> Response:
+    return Response(_dumps({"error": message}), status_code=400, media_type=JSON_MEDIA_TYPE)
+
+
+async def list_tools(request: Request) -> Response:
+    return Response(TOOL_SPECS_BYTES, media_type=JSON_MEDIA_TYPE)
+
+
+async def healthz(request: Request) -> Response:
+    return Response(b'{"status":"ok"}', media_type=JSON_MEDIA_TYPE)
+
+
+def _tool_endpoint(name: str) -> Callable:
+    async def endpoint(request: Request) -> Response:
+        try:
+            args = await _json_body(request)
+        except json.JSONDecodeError:
+            return _bad_request("request body must be JSON")
+        if not isinstance(args, dict):
+            return _bad_request("request body must be a JSON object of tool arguments")
+        status, body = tool_response_bytes(name, args)
+        return Response(body, status_code=status, media_type=JSON_MEDIA_TYPE)
+
+    endpoint.__name__ = f"tool_{name}"
+    return endpoint
+
+
+async def batch(request: Request) -> Response:
+    """Run many tool calls in one request: {"calls": [{"tool": ..., "arguments": {...}}, ...]}."""
+    try:
+        payload = await _json_body(request)
+    except json.JSONDecodeError:
+        return _bad_request("request body must be JSON")
+    calls = payload.get("calls") if isinstance(payload, dict) else None
+    if not isinstance(calls, list):
+        return _bad_request("body must contain a 'calls' list")
+    if len(calls) > MAX_BATCH_CALLS:
+        return _bad_request(f"at most {MAX_BATCH_CALLS} calls per batch")
+
+    parts: List[bytes] = []
+    for call in calls:
+        if not isinstance(call, dict) or not isinstance(call.get("arguments", {}), dict):
+            status, body = 400, _dumps({"error": "each call needs 'tool' and an 'arguments' object"})
+        else:
+            status, body = tool_response_bytes(str(call.get("tool")), call.get("arguments", {}))
+        # Splice the cached bytes in directly instead of re-encoding each result.
+        parts.append(b'{"status":%d,"result":%s}' % (status, body))
+    return Response(b'{"results":[' + b",".join(parts) + b"]}", media_type=JSON_MEDIA_TYPE)
+
+
+@functools.lru_cache(maxsize=1)
+def _agent_stream() -> Callable[..., AsyncIterator[str]]:
+    # Imported lazily: agent_demo builds an OpenAI client at import, which needs credentials.
+    from agent_demo import stream_agent
+
+    return stream_agent
+
+
+async def agent(request: Request) -> Response:
+    """Answer {"question": ..., "model": ...} and stream the text as it is generated.
+
+    The stream is an async generator on the async OpenAI client, so a slow model holds
+    no threadpool thread.
+    """
+    try:
+        payload = await _json_body(request)
+    except json.JSONDecodeError:
+        return _bad_request("request body must be JSON")
+    question = payload.get("question") if isinstance(payload, dict) else None
+    if not isinstance(question, str) or not question.strip():
+        return _bad_request("'question' is required")
+    model = payload.get("model") or "gpt-4o-mini"
+    return StreamingResponse(_agent_stream()(question, model=model), media_type="text/plain; charset=utf-8")
+
+
+routes = [
+    Route("/healthz", healthz, methods=["GET"]),
+    Route("/tools", list_tools, methods=["GET"]),
+    Route("/batch", batch, methods=["POST"]),
+    Route("/agent", agent, methods=["POST"]),
+]
+routes.extend(Route(f"/tools/{name}", _tool_endpoint(name), methods=["POST"]) for name in TOOL_REGISTRY)
+
+app = Starlette(routes=routes)
+
+
+__all__ = ["app", "tool_response_bytes", "warm_up"]
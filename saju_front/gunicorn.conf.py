@@ -0,0 +1,19 @@
+"""Gunicorn settings for serving saju_front.app with uvicorn workers."""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("SAJU_FRONT_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("SAJU_FRONT_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app (and run its warm_up) once in the master so workers fork with
+# the YAML data, search index and pre-serialized responses already in memory.
+preload_app = True
+
+# Keep client connections open between requests; must exceed the load balancer idle timeout.
+keepalive = int(os.environ.get("SAJU_FRONT_KEEPALIVE", 75))
+
+# Agent responses stream for as long as the model keeps generating.
+timeout = int(os.environ.get("SAJU_FRONT_TIMEOUT", 120))
+graceful_timeout = 30
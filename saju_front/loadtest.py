@@ -0,0 +1,147 @@
+"""
+Closed-loop load test for saju_front over keep-alive connections.
+
+Usage (three shells):
+  python -m saju_front.stub_model --port 8001
+  OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=stub gunicorn -c saju_front/gunicorn.conf.py saju_front.app:app
+  python -m saju_front.loadtest --url http://127.0.0.1:8000 --scenario all --concurrency 64 --duration 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Dict, List
+
+import httpx
+
+from tools.common import BRANCHES, ELEMENTS, STEMS
+
+
+@dataclass
+class ScenarioStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    first_byte_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def _tool_request(rng: random.Random) -> Dict:
+    choice = rng.randrange(4)
+    if choice == 0:
+        return {"url": "/tools/get_ganji_traits", "json": {"kind": "stem", "code": rng.choice(STEMS)}}
+    if choice == 1:
+        return {"url": "/tools/get_branch_full_profile", "json": {"branch": rng.choice(BRANCHES)}}
+    if choice == 2:
+        return {
+            "url": "/tools/get_branch_element_strength",
+            "json": {"branch": rng.choice(BRANCHES), "element": rng.choice(ELEMENTS)},
+        }
+    return {"url": "/tools/search_knowledge", "json": {"query": rng.choice(["리더십", "간/근육", "교육", "소통"])}}
+
+
+def _batch_request(rng: random.Random) -> Dict:
+    calls = [
+        {"tool": "get_branch_properties", "arguments": {"branch": branch}}
+        for branch in rng.sample(BRANCHES, 4)
+    ] + [{"tool": "get_stem_purpose", "arguments": {"stem": stem}} for stem in rng.sample(STEMS, 4)]
+    return {"url": "/batch", "json": {"calls": calls}}
+
+
+async def _run_plain(client: httpx.AsyncClient, request: Dict, stats: ScenarioStats) -> None:
+    start = time.perf_counter()
+    response = await client.post(request["url"], json=request["json"])
+    stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+    if response.status_code != 200:
+        stats.errors += 1
+
+
+async def _run_agent(client: httpx.AsyncClient, rng: random.Random, stats: ScenarioStats) -> None:
+    question = f"{rng.choice(STEMS + BRANCHES)}는 어떤 성격인가요?"
+    start = time.perf_counter()
+    first_byte = None
+    async with client.stream("POST", "/agent", json={"question": question}) as response:
+        async for _ in response.aiter_bytes():
+            if first_byte is None:
+                first_byte = time.perf_counter()
+        if response.status_code != 200:
+            stats.errors += 1
+    end = time.perf_counter()
+    stats.latencies_ms.append((end - start) * 1000)
+    if first_byte is not None:
+        stats.first_byte_ms.append((first_byte - start) * 1000)
+
+
+def _scenario(name: str, client: httpx.AsyncClient, rng: random.Random, stats: ScenarioStats) -> Awaitable[None]:
+    if name == "tool":
+        return _run_plain(client, _tool_request(rng), stats)
+    if name == "batch":
+        return _run_plain(client, _batch_request(rng), stats)
+    return _run_agent(client, rng, stats)
+
+
+async def _worker(
+    worker_id: int,
+    client: httpx.AsyncClient,
+    scenarios: List[str],
+    deadline: float,
+    stats: Dict[str, ScenarioStats],
+) -> None:
+    rng = random.Random(worker_id)
+    while time.perf_counter() < deadline:
+        name = rng.choice(scenarios)
+        try:
+            await _scenario(name, client, rng, stats[name])
+        except httpx.HTTPError:
+            stats[name].errors += 1
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _report(stats: Dict[str, ScenarioStats], elapsed: float) -> None:
+    total = 0
+    for name, scenario in stats.items():
+        count = len(scenario.latencies_ms)
+        total += count
+        if not count:
+            print(f"{name:>6}: no completed requests ({scenario.errors} errors)")
+            continue
+        line = (
+            f"{name:>6}: {count} req, {count / elapsed:.1f} req/s, errors {scenario.errors}, "
+            f"p50 {statistics.median(scenario.latencies_ms):.1f}ms, "
+            f"p95 {_percentile(scenario.latencies_ms, 95):.1f}ms, "
+            f"p99 {_percentile(scenario.latencies_ms, 99):.1f}ms"
+        )
+        if scenario.first_byte_ms:
+            line += f", first byte p50 {statistics.median(scenario.first_byte_ms):.1f}ms"
+        print(line)
+    print(f" total: {total} req in {elapsed:.1f}s, {total / elapsed:.1f} req/s")
+
+
+async def run_load(url: str, scenarios: List[str], concurrency: int, duration: float) -> None:
+    stats = {name: ScenarioStats() for name in scenarios}
+    # One pooled client: connections are reused (keep-alive) across requests.
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(_worker(i, client, scenarios, deadline, stats) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    _report(stats, elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", choices=["tool", "batch", "agent", "all"], default="all")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    cli_args = parser.parse_args()
+    selected = ["tool", "batch", "agent"] if cli_args.scenario == "all" else [cli_args.scenario]
+    asyncio.run(run_load(cli_args.url, selected, cli_args.concurrency, cli_args.duration))
@@ -0,0 +1,146 @@
+"""
+Minimal OpenAI-compatible chat completions server for load testing without a real model.
+
+Usage:
+  python -m saju_front.stub_model --port 8001 --latency-ms 300
+  OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=stub gunicorn -c saju_front/gunicorn.conf.py saju_front.app:app
+
+The first call of a conversation (tools offered, no tool results yet) looks up the
+first stem, branch or element in the question: with one call to its full_profile tool
+when that tool is offered, otherwise with parallel calls to the primitive tools it
+combines. Later calls answer with a short canned text, streamed token by token when
+``stream`` is set. This tool choice is scripted: it exercises the agent and server
+plumbing but says nothing about how a real model picks tools.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from tools.common import BRANCHES, ELEMENTS, STEMS
+
+LATENCY_MS = 300
+TOKEN_DELAY_MS = 10
+ANSWER_TOKENS: List[str] = ["조회한 ", "특성을 ", "바탕으로 ", "간단히 ", "정리하면 ", "다음과 ", "같습니다."]
+
+
+INTERPRETATION_CONTEXTS: List[str] = ["default", "season", "career", "relationship", "health"]
+
+ToolCall = Tuple[str, Dict[str, Any]]
+
+
+def _lookup_plan(code: str) -> Tuple[ToolCall, List[ToolCall]]:
+    """Return the composite call for a code and the primitive calls it replaces."""
+    if code in BRANCHES:
+        primitives = [
+            ("get_branch_properties", {"branch": code}),
+            ("get_ganji_traits", {"kind": "branch", "code": code}),
+            ("get_hidden_stems", {"branch": code}),
+            ("get_month_branch", {"branch": code}),
+        ]
+        primitives += [("get_branch_element_strength", {"branch": code, "element": e}) for e in ELEMENTS]
+        return ("get_branch_full_profile", {"branch": code}), primitives
+    if code in ELEMENTS:
+        primitives = [("get_element_profile", {"element": code})]
+        primitives += [
+            ("get_element_interpretation_contextual", {"stem_or_element": code, "context": c})
+            for c in INTERPRETATION_CONTEXTS
+        ]
+        primitives += [("get_five_element_relation", {"source": code, "target": e}) for e in ELEMENTS if e != code]
+        return ("get_element_full_profile", {"element": code}), primitives
+    primitives = [("get_ganji_traits", {"kind": "stem", "code": code}), ("get_stem_purpose", {"stem": code})]
+    primitives += [
+        ("get_element_interpretation_contextual", {"stem_or_element": code, "context": c})
+        for c in INTERPRETATION_CONTEXTS
+    ]
+    return ("get_stem_full_profile", {"stem": code}), primitives
+
+
+def _plan_tool_calls(messages: List[Dict[str, Any]], tools: List[Dict[str, Any]]) -> List[ToolCall]:
+    question = next((m.get("content") or "" for m in messages if m.get("role") == "user"), "")
+    code = next((char for char in question if char in STEMS or char in BRANCHES or char in ELEMENTS), STEMS[0])
+    offered = {tool.get("function", {}).get("name") for tool in tools}
+    composite, primitives = _lookup_plan(code)
+    if composite[0] in offered:
+        return [composite]
+    return [call for call in primitives if call[0] in offered]
+
+
+def _completion(model: str, message: Dict[str, Any], finish_reason: str) -> Dict[str, Any]:
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+async def _stream_answer(model: str) -> AsyncIterator[bytes]:
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    for token in ANSWER_TOKENS:
+        await asyncio.sleep(TOKEN_DELAY_MS / 1000)
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+        }
+        yield b"data: " + json.dumps(chunk, ensure_ascii=False).encode("utf-8") + b"\n\n"
+    yield b"data: [DONE]\n\n"
+
+
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model", "stub")
+    messages = body.get("messages", [])
+    await asyncio.sleep(LATENCY_MS / 1000)
+
+    planned: List[ToolCall] = []
+    if body.get("tools") and not any(m.get("role") == "tool" for m in messages):
+        planned = _plan_tool_calls(messages, body["tools"])
+    if planned:
+        tool_calls = [
+            {
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(args, ensure_ascii=False)},
+            }
+            for name, args in planned
+        ]
+        message = {"role": "assistant", "content": None, "tool_calls": tool_calls}
+        return JSONResponse(_completion(model, message, "tool_calls"))
+
+    if body.get("stream"):
+        return StreamingResponse(_stream_answer(model), media_type="text/event-stream")
+    message = {"role": "assistant", "content": "".join(ANSWER_TOKENS)}
+    return JSONResponse(_completion(model, message, "stop"))
+
+
+app = Starlette(routes=[Route("/v1/chat/completions", chat_completions, methods=["POST"])])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=int, default=LATENCY_MS, help="delay before each completion")
+    parser.add_argument("--token-delay-ms", type=int, default=TOKEN_DELAY_MS, help="delay between streamed tokens")
+    cli_args = parser.parse_args()
+    LATENCY_MS = cli_args.latency_ms
+    TOKEN_DELAY_MS = cli_args.token_delay_ms
+    uvicorn.run(app, host=cli_args.host, port=cli_args.port, log_level="warning")
@@ -0,0 +1,150 @@
+"""
+Multi-turn conversation sessions for the function-calling agent.
+
+Messages are laid out so the start of every request is byte-identical across turns
+and sessions (tools, then the fixed system prompt), which lets provider-side prompt
+caching serve it. Per-session data follows that prefix: a compact summary of turns
+that no longer fit, then the most recent turns, then the new question.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+SUMMARY_ITEM_CHARS = 80
+
+
+@dataclass
+class Turn:
+    question: str
+    answer: str
+
+    @property
+    def size(self) -> int:
+        return len(self.question) + len(self.answer)
+
+
+@dataclass
+class Session:
+    """One conversation. Hold ``lock`` for a whole turn so concurrent requests cannot interleave."""
+
+    session_id: str
+    turns: List[Turn] = field(default_factory=list)
+    summary: str = ""
+    last_used: float = field(default_factory=time.monotonic)
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def messages(self, system_prompt: str, question: str) -> List[Dict[str, Any]]:
+        """Build the request messages: stable prefix, then session state, then the question."""
+        messages: List[Dict[str, Any]] = [{"role": "system", "content": system_prompt}]
+        if self.summary:
+            messages.append({"role": "system", "content": f"이전 대화 요약:\n{self.summary}"})
+        for turn in self.turns:
+            messages.append({"role": "user", "content": turn.question})
+            messages.append({"role": "assistant", "content": turn.answer})
+        messages.append({"role": "user", "content": question})
+        return messages
+
+
+def _shorten(text: str, limit: int = SUMMARY_ITEM_CHARS) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def response_usage(response: Any) -> Tuple[int, int]:
+    """Return (prompt_tokens, cached_prompt_tokens) from a chat completion response."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return 0, 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(usage, "prompt_tokens", 0) or 0, getattr(details, "cached_tokens", 0) or 0
+
+
+class SessionStore:
+    """In-memory session store with LRU size and idle-TTL eviction."""
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        ttl_seconds: float = 1800.0,
+        max_history_chars: int = 6000,
+        max_summary_chars: int = 1500,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.max_history_chars = max_history_chars
+        self.max_summary_chars = max_summary_chars
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Session:
+        """Return the session, creating it if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = Session(session_id)
+                self._sessions[session_id] = session
+            self._sessions.move_to_end(session_id)
+            self._evict_overflow()
+            session.last_used = now
+            return session
+
+    def drop(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def record_turn(self, session: Session, question: str, answer: str) -> None:
+        """Append a finished turn and fold the oldest turns into the summary when over budget.
+
+        Folding happens in blocks, down to half the budget, so the summary and the
+        early turns stay byte-identical (and cacheable) for many turns in between.
+        """
+        with self._lock:
+            # Re-attach a session evicted between get() and the turn taking its lock.
+            self._sessions.setdefault(session.session_id, session)
+            session.turns.append(Turn(question, answer))
+            folded: List[Turn] = []
+            history = sum(t.size for t in session.turns)
+            if history > self.max_history_chars:
+                # Always keep the latest turn verbatim.
+                while len(session.turns) > 1 and history > self.max_history_chars // 2:
+                    turn = session.turns.pop(0)
+                    history -= turn.size
+                    folded.append(turn)
+            if folded:
+                lines = [f"- Q: {_shorten(t.question)} / A: {_shorten(t.answer)}" for t in folded]
+                summary = "\n".join(([session.summary] if session.summary else []) + lines)
+                if len(summary) > self.max_summary_chars:
+                    # Drop the oldest summary lines first.
+                    summary = summary[-self.max_summary_chars :].split("\n", 1)[-1]
+                session.summary = summary
+
+    def _evict_expired(self, now: float) -> None:
+        for session_id, session in list(self._sessions.items()):
+            if now - session.last_used <= self.ttl_seconds:
+                break
+            # A locked session has a turn in flight; evicting it would lose that turn.
+            if not session.lock.locked():
+                del self._sessions[session_id]
+
+    def _evict_overflow(self) -> None:
+        # The newest entry (just requested) is never evicted; busy sessions are skipped.
+        for session_id, session in list(self._sessions.items())[:-1]:
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if not session.lock.locked():
+                del self._sessions[session_id]
+
+
+__all__ = ["Session", "SessionStore", "Turn", "response_usage"]
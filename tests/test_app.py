@@ -0,0 +1,34 @@
+import json
+
+from starlette.testclient import TestClient
+
+from saju_front.app import app
+from tools import TOOL_REGISTRY
+
+
+def test_batch_isolates_each_call(monkeypatch):
+    def flaky():
+        raise RuntimeError("backend down")
+
+    monkeypatch.setitem(TOOL_REGISTRY, "flaky", flaky)
+    client = TestClient(app)
+    calls = [
+        {"tool": "get_ganji_traits", "arguments": {"kind": "stem", "code": "甲"}},
+        {"tool": "get_ganji_traits", "arguments": {"kind": 1}},
+        {"tool": "flaky", "arguments": {}},
+        {"tool": "missing", "arguments": {}},
+        "not a call",
+    ]
+
+    response = client.post("/batch", content=json.dumps({"calls": calls}))
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [200, 400, 500, 404, 400]
+    assert results[2]["result"]["error"] == "RuntimeError: backend down"
+
+    # Unexpected failures are not cached: the next call runs the tool again.
+    monkeypatch.setitem(TOOL_REGISTRY, "flaky", lambda: {"ok": True})
+    assert client.post("/tools/get_ganji_traits", json={"kind": 1}).status_code == 400
+    again = client.post("/batch", json={"calls": [{"tool": "flaky", "arguments": {}}]}).json()["results"][0]
+    assert again == {"status": 200, "result": {"ok": True}}
@@ -0,0 +1,26 @@
+from tools import get_chart_balance
+from tools.element_scoring import ChartScore, parse_pillar
+
+
+def test_strong_chart_never_recommends_its_excess():
+    result = get_chart_balance("甲寅", "乙卯", "甲寅", "甲寅")
+    assert result["strength"] == "신강"
+    assert "木" in result["excess"]
+    assert set(result["recommended_elements"]).isdisjoint(result["excess"])
+    # 金 controls the strong 木 day master, so 甲's static avoid list must not drop it.
+    assert "金" in result["recommended_elements"]
+    assert "水" not in result["recommended_elements"]
+
+
+def test_weak_chart_does_not_recommend_draining_elements():
+    result = get_chart_balance("甲子", "丙寅", "戊辰")
+    assert result["strength"] == "신약"
+    assert set(result["recommended_elements"]).isdisjoint(result["excess"])
+    assert "金" not in result["recommended_elements"]
+
+
+def test_set_pillar_matches_fresh_score():
+    chart = ChartScore({"year": parse_pillar("甲子"), "month": parse_pillar("丙寅"), "day": parse_pillar("戊辰")})
+    chart.set_pillar("month", "丁", "卯")
+    fresh = ChartScore({"year": parse_pillar("甲子"), "month": parse_pillar("丁卯"), "day": parse_pillar("戊辰")})
+    assert all(abs(a - b) < 1e-9 for a, b in zip(chart.totals, fresh.totals))
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+from report_generator import generate_reports, iter_charts, main
+
+
+def test_bad_rows_become_error_entries(tmp_path):
+    path = tmp_path / "charts.jsonl"
+    rows = [
+        json.dumps({"id": "ok", "year": "甲子", "month": "丙寅", "day": "戊辰"}, ensure_ascii=False),
+        json.dumps({"id": "typed", "year": "甲子", "month": "丙寅", "day": "戊辰", "hour": 5}, ensure_ascii=False),
+        '{"id": "trunc", "year": "甲',
+        "7",
+    ]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    reports = [json.loads(text) for text in generate_reports(iter_charts([path]), fmt="json")]
+
+    assert [report.get("error") is None for report in reports] == [True, False, False, False]
+    assert reports[2]["id"] == f"{path}:3"
+
+
+def test_polish_model_requires_markdown(tmp_path, capsys):
+    path = tmp_path / "charts.jsonl"
+    path.write_text("", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        main([str(path), "--format", "json", "--polish-model", "gpt-4o-mini"])
+    assert "--polish-model" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        list(generate_reports([], fmt="json", polish_model="gpt-4o-mini"))
@@ -0,0 +1,27 @@
+from session_store import SessionStore
+
+
+def test_folding_keeps_prefix_stable_between_folds():
+    store = SessionStore(max_history_chars=100)
+    session = store.get("s")
+    prefixes = []
+    for i in range(12):
+        store.record_turn(session, f"q{i}" * 5, f"a{i}" * 5)
+        messages = session.messages("system", "next")
+        prefixes.append(tuple(m["content"] for m in messages[:3]))
+        assert sum(turn.size for turn in session.turns) <= store.max_history_chars
+
+    # Each fold drops history to half the budget, so most turns reuse the previous prefix.
+    changes = sum(1 for before, after in zip(prefixes, prefixes[1:]) if before != after)
+    assert changes <= len(prefixes) // 3
+    assert session.summary.startswith("- Q: q0")
+
+
+def test_eviction_skips_sessions_with_a_turn_in_flight():
+    store = SessionStore(max_sessions=1)
+    busy = store.get("busy")
+    with busy.lock:
+        store.get("other")
+        store.record_turn(busy, "q", "a")
+    assert store.get("busy") is busy
+    assert busy.turns[-1].answer == "a"
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from tools.spec_compiler import compile_tool_specs
+
+
+def _tool(name):
+    return {"type": "function", "function": {"name": name, "parameters": {"type": "object", "properties": {}}}}
+
+
+def _write(path, payload):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_include_cycle_is_rejected(tmp_path):
+    _write(tmp_path / "tools.json", [{"$include": "a.json"}])
+    _write(tmp_path / "a.json", [_tool("a"), {"$include": "b.json"}])
+    _write(tmp_path / "b.json", [{"$include": "a.json"}])
+    with pytest.raises(ValueError, match="cycle"):
+        compile_tool_specs(tmp_path / "tools.json")
+
+
+def test_duplicate_tool_names_are_rejected(tmp_path):
+    _write(tmp_path / "tools.json", [_tool("a"), {"$include": "a.json"}])
+    _write(tmp_path / "a.json", _tool("a"))
+    with pytest.raises(ValueError, match="duplicate tool name 'a'"):
+        compile_tool_specs(tmp_path / "tools.json")
+
+
+def test_recompiles_only_when_a_source_changes(tmp_path):
+    _write(tmp_path / "tools.json", [{"$include": "a.json"}])
+    _write(tmp_path / "a.json", _tool("a"))
+    first = compile_tool_specs(tmp_path / "tools.json")
+    assert compile_tool_specs(tmp_path / "tools.json") is first
+
+    _write(tmp_path / "a.json", _tool("renamed"))
+    second = compile_tool_specs(tmp_path / "tools.json")
+    assert second is not first
+    assert list(second.function_specs) == ["renamed"]
@@ -0,0 +1,23 @@
+import threading
+
+from tools.tracing import begin_trace, span, use_trace
+
+
+def test_manual_trace_collects_spans_from_other_threads():
+    active = begin_trace("stream", sample_rate=1.0)
+    assert active is not None
+
+    def resume():
+        # A streaming body may resume on another thread without the caller's context.
+        with use_trace(active), span("llm.chat_completion", category="llm"):
+            pass
+
+    with use_trace(active), span("tool.lookup", category="tool"):
+        pass
+    worker = threading.Thread(target=resume)
+    worker.start()
+    worker.join()
+    active.finish(export=False)
+
+    assert [event["name"] for event in active.events] == ["tool.lookup", "llm.chat_completion", "stream"]
+    assert begin_trace("unsampled", sample_rate=0.0) is None
@@ -1,15 +1,21 @@
 """Tool package for ganji-related utilities and future extensions."""
 
 from .get_branch_element_strength import get_branch_element_strength
+from .get_branch_full_profile import get_branch_full_profile
 from .get_branch_interaction import get_branch_interaction
 from .get_branch_properties import get_branch_properties
+from .get_chart_balance import get_chart_balance
+from .get_element_full_profile import get_element_full_profile
 from .get_element_interpretation_contextual import get_element_interpretation_contextual
 from .get_element_profile import get_element_profile
 from .get_five_element_relation import get_five_element_relation
 from .get_ganji_traits import get_ganji_traits
 from .get_hidden_stems import get_hidden_stems
 from .get_month_branch import get_month_branch
+from .get_stem_full_profile import get_stem_full_profile
 from .get_stem_purpose import get_stem_purpose
+from .search_knowledge import search_knowledge
+from .spec_compiler import compile_tool_specs
 from .spec_loader import load_tool_specs
 
 TOOL_REGISTRY = {
@@ -23,6 +29,11 @@ TOOL_REGISTRY = {
     "get_five_element_relation": get_five_element_relation,
     "get_hidden_stems": get_hidden_stems,
     "get_stem_purpose": get_stem_purpose,
+    "search_knowledge": search_knowledge,
+    "get_branch_full_profile": get_branch_full_profile,
+    "get_stem_full_profile": get_stem_full_profile,
+    "get_element_full_profile": get_element_full_profile,
+    "get_chart_balance": get_chart_balance,
 }
 
 __all__ = [
@@ -36,6 +47,12 @@ __all__ = [
     "get_five_element_relation",
     "get_hidden_stems",
     "get_stem_purpose",
+    "search_knowledge",
+    "get_branch_full_profile",
+    "get_stem_full_profile",
+    "get_element_full_profile",
+    "get_chart_balance",
+    "compile_tool_specs",
     "load_tool_specs",
     "TOOL_REGISTRY",
 ]
@@ -10,6 +10,8 @@ from typing import Any, Dict
 
 import yaml
 
+from .tracing import span
+
 TOOLS_DIR = Path(__file__).parent
 
 
@@ -21,7 +23,9 @@ def load_yaml_resource(relative_path: str) -> Dict[str, Any]:
         path = path.with_suffix(".yaml")
     if not path.exists():
         raise FileNotFoundError(f"YAML resource not found: {path}")
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    # Only the first (uncached) load of each file shows up in traces.
+    with span("yaml.load", category="io", path=relative_path):
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         raise ValueError(f"YAML resource '{relative_path}' must have a top-level mapping.")
     return data
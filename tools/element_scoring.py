@@ -0,0 +1,193 @@
+"""Five-element scoring of a chart from precomputed per-pillar contribution vectors."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, List, Mapping, Tuple
+
+from .common import BRANCHES, ELEMENTS, STEM_TO_ELEMENT, STEMS, ensure_branch, ensure_stem
+from .data_loader import load_yaml_resource
+from .get_branch_element_strength import RESOURCE_PATH as STRENGTH_PATH
+from .get_five_element_relation import RESOURCE_PATH as RELATION_PATH
+from .get_hidden_stems import RESOURCE_PATH as HIDDEN_STEMS_PATH
+from .get_stem_purpose import get_stem_purpose
+
+Vector = Tuple[float, ...]
+
+# Natal pillars plus an optional luck pillar (대운/세운) overlaid on top.
+POSITIONS: List[str] = ["year", "month", "day", "hour", "luck"]
+
+STEM_WEIGHTS: Dict[str, float] = {"year": 1.0, "month": 1.0, "day": 1.0, "hour": 1.0, "luck": 1.0}
+# The month branch (월령) carries the most weight, the day branch (일지) next.
+BRANCH_WEIGHTS: Dict[str, float] = {"year": 1.0, "month": 2.0, "day": 1.2, "hour": 1.0, "luck": 1.0}
+# Seasonal strength applies only where the branch sets the season.
+SEASON_WEIGHTS: Dict[str, float] = {"year": 0.0, "month": 1.0, "day": 0.0, "hour": 0.0, "luck": 0.5}
+
+# Hidden stems are listed main qi (본기) first.
+HIDDEN_STEM_SHARES: Dict[int, Vector] = {1: (1.0,), 2: (0.7, 0.3), 3: (0.6, 0.3, 0.1)}
+STRENGTH_SCORES: Dict[str, float] = {"strong": 1.0, "high": 0.6, "growing": 0.4, "medium": 0.2, "weak": 0.0}
+
+STRONG_SUPPORT_RATIO = 0.5
+EXCESS_SHARE = 0.3
+MISSING_SHARE = 0.05
+
+_ZERO: Vector = (0.0,) * len(ELEMENTS)
+_INDEX = {element: i for i, element in enumerate(ELEMENTS)}
+
+
+def _one_hot(element: str, weight: float) -> Vector:
+    vector = [0.0] * len(ELEMENTS)
+    vector[_INDEX[element]] = weight
+    return tuple(vector)
+
+
+def _add(a: Vector, b: Vector) -> Vector:
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def _sub(a: Vector, b: Vector) -> Vector:
+    return tuple(x - y for x, y in zip(a, b))
+
+
+def _branch_vector(branch: str, position: str) -> Vector:
+    hidden = []
+    for item in load_yaml_resource(HIDDEN_STEMS_PATH).get("hidden_stems", []):
+        if item.get("branch") == branch:
+            hidden = item.get("stems", [])
+            break
+    vector = _ZERO
+    for stem, share in zip(hidden, HIDDEN_STEM_SHARES.get(len(hidden), ())):
+        vector = _add(vector, _one_hot(STEM_TO_ELEMENT[stem], BRANCH_WEIGHTS[position] * share))
+
+    season_weight = SEASON_WEIGHTS[position]
+    if season_weight:
+        strengths = load_yaml_resource(STRENGTH_PATH).get("strength_map", {}).get(branch, {})
+        season = tuple(season_weight * STRENGTH_SCORES.get(strengths.get(e, ""), 0.0) for e in ELEMENTS)
+        vector = _add(vector, season)
+    return vector
+
+
+@functools.lru_cache(maxsize=1)
+def _contribution_tables() -> Tuple[Dict[Tuple[str, str], Vector], Dict[Tuple[str, str], Vector]]:
+    """Precompute the vector for every (stem, position) and (branch, position)."""
+    stem_table = {
+        (stem, position): _one_hot(STEM_TO_ELEMENT[stem], STEM_WEIGHTS[position])
+        for stem in STEMS
+        for position in POSITIONS
+    }
+    branch_table = {(branch, position): _branch_vector(branch, position) for branch in BRANCHES for position in POSITIONS}
+    return stem_table, branch_table
+
+
+@functools.lru_cache(maxsize=1)
+def _relations() -> Dict[str, Dict[str, str]]:
+    data = load_yaml_resource(RELATION_PATH).get("relations", {})
+    return {"생": dict(data.get("생", {})), "극": dict(data.get("극", {}))}
+
+
+def parse_pillar(pillar: str) -> Tuple[str, str]:
+    """Split a two-character pillar such as '甲子' into (stem, branch)."""
+    pillar = pillar.strip()
+    if len(pillar) != 2:
+        raise ValueError("pillar must be a stem followed by a branch, e.g. '甲子'")
+    return ensure_stem(pillar[0]), ensure_branch(pillar[1])
+
+
+def pillar_vector(position: str, stem: str, branch: str) -> Vector:
+    """Return the five-element contribution of one pillar at a position."""
+    if position not in POSITIONS:
+        raise ValueError(f"position must be one of {POSITIONS}")
+    stem_table, branch_table = _contribution_tables()
+    return _add(stem_table[(ensure_stem(stem), position)], branch_table[(ensure_branch(branch), position)])
+
+
+class ChartScore:
+    """Running element totals for a chart; changing one pillar re-scores only that pillar."""
+
+    def __init__(self, pillars: Mapping[str, Tuple[str, str]]) -> None:
+        if "day" not in pillars:
+            raise ValueError("the day pillar is required")
+        self.pillars: Dict[str, Tuple[str, str]] = {}
+        self._vectors: Dict[str, Vector] = {}
+        self.totals: Vector = _ZERO
+        for position, (stem, branch) in pillars.items():
+            self.set_pillar(position, stem, branch)
+
+    @property
+    def day_stem(self) -> str:
+        return self.pillars["day"][0]
+
+    def set_pillar(self, position: str, stem: str, branch: str) -> None:
+        """Add or replace a pillar, e.g. to overlay a luck pillar."""
+        vector = pillar_vector(position, stem, branch)
+        self.totals = _add(_sub(self.totals, self._vectors.get(position, _ZERO)), vector)
+        self._vectors[position] = vector
+        self.pillars[position] = (stem, branch)
+
+    def remove_pillar(self, position: str) -> None:
+        if position == "day":
+            raise ValueError("the day pillar cannot be removed")
+        if position in self._vectors:
+            self.totals = _sub(self.totals, self._vectors.pop(position))
+            del self.pillars[position]
+
+    def copy(self) -> "ChartScore":
+        clone = ChartScore.__new__(ChartScore)
+        clone.pillars = dict(self.pillars)
+        clone._vectors = dict(self._vectors)
+        clone.totals = self.totals
+        return clone
+
+    def balance(self) -> Dict[str, Any]:
+        """Summarise strength (신강/신약), excess and missing elements, and recommendations."""
+        relations = _relations()
+        scores = dict(zip(ELEMENTS, self.totals))
+        total = sum(scores.values()) or 1.0
+        shares = {element: score / total for element, score in scores.items()}
+
+        day_element = STEM_TO_ELEMENT[self.day_stem]
+        resource = next(e for e, target in relations["생"].items() if target == day_element)
+        support_ratio = shares[day_element] + shares[resource]
+        strength = "신강" if support_ratio >= STRONG_SUPPORT_RATIO else "신약"
+
+        drain = relations["생"][day_element]
+        wealth = relations["극"][day_element]
+        controller = next(e for e, target in relations["극"].items() if target == day_element)
+        if strength == "신강":
+            # Drain (식상), wealth (재성) and control (관성) relieve a strong day master.
+            balancing = [drain, wealth, controller]
+            opposing = {day_element, resource}
+        else:
+            balancing = [resource, day_element]
+            opposing = {drain, wealth, controller}
+
+        excess = [e for e in ELEMENTS if shares[e] >= EXCESS_SHARE]
+        missing = [e for e in ELEMENTS if shares[e] < MISSING_SHARE]
+        purpose = get_stem_purpose(self.day_stem)
+        # The stem's static avoid list never overrides what this chart's balance calls for.
+        avoid = [e for e in purpose.get("avoid", []) if e not in balancing]
+        recommended: List[str] = []
+        for element in balancing:
+            if element not in excess and element not in recommended:
+                recommended.append(element)
+        for element in missing + list(purpose.get("recommend", [])):
+            if element in excess or element in opposing or element in avoid or element in recommended:
+                continue
+            recommended.append(element)
+
+        return {
+            "pillars": {position: stem + branch for position, (stem, branch) in self.pillars.items()},
+            "day_stem": self.day_stem,
+            "day_element": day_element,
+            "scores": {element: round(score, 2) for element, score in scores.items()},
+            "shares": {element: round(share, 3) for element, share in shares.items()},
+            "support_ratio": round(support_ratio, 3),
+            "strength": strength,
+            "excess": excess,
+            "missing": missing,
+            "recommended_elements": recommended,
+            "avoid_elements": list(dict.fromkeys(avoid + excess)),
+        }
+
+
+__all__ = ["POSITIONS", "ChartScore", "parse_pillar", "pillar_vector"]
@@ -0,0 +1,53 @@
+"""Composite branch lookup joining properties, traits, hidden stems, month and strengths."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict
+
+from ..common import BRANCHES, ELEMENTS, STEM_TO_ELEMENT, ensure_branch
+from ..get_branch_element_strength import get_branch_element_strength
+from ..get_branch_interaction import get_branch_interaction
+from ..get_branch_properties import get_branch_properties
+from ..get_ganji_traits import get_ganji_traits
+from ..get_hidden_stems import get_hidden_stems
+from ..get_month_branch import get_month_branch
+
+
+def _build_profile(branch: str) -> Dict[str, Any]:
+    properties = get_branch_properties(branch)
+    hidden = get_hidden_stems(branch).get("stems", [])
+    interactions = {}
+    for other in BRANCHES:
+        relation = get_branch_interaction(branch, other)["relation"]
+        if relation not in {"none", "same"}:
+            interactions[other] = relation
+    return {
+        "branch": branch,
+        "element": properties.get("element"),
+        "yinyang": properties.get("yinyang"),
+        "season": properties.get("season"),
+        "notes": properties.get("notes"),
+        "traits": get_ganji_traits("branch", branch).get("traits", {}),
+        "hidden_stems": [{"stem": stem, "element": STEM_TO_ELEMENT.get(stem)} for stem in hidden],
+        "month": get_month_branch(branch=branch).get("month"),
+        "element_strength": {
+            element: get_branch_element_strength(branch, element).get("strength") for element in ELEMENTS
+        },
+        "interactions": interactions,
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _profiles() -> Dict[str, Dict[str, Any]]:
+    """Precompute the joined profile for every branch on first use."""
+    return {branch: _build_profile(branch) for branch in BRANCHES}
+
+
+def get_branch_full_profile(branch: str) -> Dict[str, Any]:
+    """Return everything known about a branch in a single lookup."""
+    branch = ensure_branch(branch)
+    return _profiles()[branch]
+
+
+__all__ = ["get_branch_full_profile"]
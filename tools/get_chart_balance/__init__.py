@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from ..element_scoring import ChartScore, parse_pillar
+
+
+def get_chart_balance(
+    year_pillar: str,
+    month_pillar: str,
+    day_pillar: str,
+    hour_pillar: str | None = None,
+    luck_pillar: str | None = None,
+) -> Dict[str, Any]:
+    """Score the five-element balance of a chart, optionally with a luck pillar overlaid."""
+    pillars = {"year": year_pillar, "month": month_pillar, "day": day_pillar, "hour": hour_pillar}
+    chart = ChartScore({position: parse_pillar(value) for position, value in pillars.items() if value})
+    result = chart.balance()
+    if luck_pillar:
+        chart.set_pillar("luck", *parse_pillar(luck_pillar))
+        result["with_luck"] = chart.balance()
+    return result
+
+
+__all__ = ["get_chart_balance"]
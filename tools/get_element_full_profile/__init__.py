@@ -0,0 +1,59 @@
+"""Composite element lookup joining profile, interpretations, relations and branch strengths."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict
+
+from ..common import BRANCHES, ELEMENTS, STEM_TO_ELEMENT, STEMS, ensure_element
+from ..data_loader import load_yaml_resource
+from ..get_branch_element_strength import get_branch_element_strength
+from ..get_branch_properties import get_branch_properties
+from ..get_element_interpretation_contextual import RESOURCE_PATH as INTERPRETATION_PATH
+from ..get_element_profile import get_element_profile
+from ..get_five_element_relation import get_five_element_relation
+
+
+def _build_profile(element: str) -> Dict[str, Any]:
+    profile = get_element_profile(element)
+    interpretations = load_yaml_resource(INTERPRETATION_PATH).get("interpretations", {})
+    relations: Dict[str, Any] = {"generates": None, "generated_by": None, "controls": None, "controlled_by": None}
+    for other in ELEMENTS:
+        forward = get_five_element_relation(element, other)["relation"]
+        backward = get_five_element_relation(other, element)["relation"]
+        if forward == "생":
+            relations["generates"] = other
+        elif forward == "극":
+            relations["controls"] = other
+        if backward == "생":
+            relations["generated_by"] = other
+        elif backward == "극":
+            relations["controlled_by"] = other
+    return {
+        "element": element,
+        "traits": profile.get("traits"),
+        "keywords": profile.get("keywords", []),
+        "recommends": profile.get("recommends", []),
+        "interpretations": dict(interpretations.get(element, {})),
+        "relations": relations,
+        "stems": [stem for stem in STEMS if STEM_TO_ELEMENT[stem] == element],
+        "branches": [branch for branch in BRANCHES if get_branch_properties(branch).get("element") == element],
+        "strength_by_branch": {
+            branch: get_branch_element_strength(branch, element).get("strength") for branch in BRANCHES
+        },
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _profiles() -> Dict[str, Dict[str, Any]]:
+    """Precompute the joined profile for every element on first use."""
+    return {element: _build_profile(element) for element in ELEMENTS}
+
+
+def get_element_full_profile(element: str) -> Dict[str, Any]:
+    """Return profile, interpretations, 생/극 relations and seasonal strengths for an element."""
+    element = ensure_element(element)
+    return _profiles()[element]
+
+
+__all__ = ["get_element_full_profile"]
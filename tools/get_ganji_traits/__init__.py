@@ -8,6 +8,8 @@ from typing import Dict, List, Literal, TypedDict
 
 import yaml
 
+from ..tracing import span
+
 # Trait data lives next to this module so it can be packaged together.
 _TRAITS_PATH = Path(__file__).with_name("ganji_traits.yaml")
 
@@ -28,7 +30,8 @@ def _load_traits(path: Path = _TRAITS_PATH) -> Dict:
     if not path.exists():
         raise FileNotFoundError(f"Trait data not found: {path}")
 
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    with span("yaml.load", category="io", path=path.name):
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         raise ValueError("Trait file is malformed: expected a mapping at the top level.")
 
@@ -0,0 +1,45 @@
+"""Composite stem lookup joining traits, purpose and contextual interpretations."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict
+
+from ..common import STEMS, ensure_stem
+from ..data_loader import load_yaml_resource
+from ..get_element_interpretation_contextual import RESOURCE_PATH as INTERPRETATION_PATH
+from ..get_ganji_traits import get_ganji_traits
+from ..get_stem_purpose import get_stem_purpose
+
+
+def _build_profile(stem: str) -> Dict[str, Any]:
+    traits = get_ganji_traits("stem", stem)
+    purpose = get_stem_purpose(stem)
+    element = traits.get("element")
+    interpretations = load_yaml_resource(INTERPRETATION_PATH).get("interpretations", {})
+    return {
+        "stem": stem,
+        "element": element,
+        "yinyang": traits.get("yinyang"),
+        "traits": traits.get("traits", {}),
+        "purpose": purpose.get("purpose"),
+        "notes": purpose.get("notes", []),
+        "recommend": purpose.get("recommend", []),
+        "avoid": purpose.get("avoid", []),
+        "interpretations": dict(interpretations.get(element, {})),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _profiles() -> Dict[str, Dict[str, Any]]:
+    """Precompute the joined profile for every stem on first use."""
+    return {stem: _build_profile(stem) for stem in STEMS}
+
+
+def get_stem_full_profile(stem: str) -> Dict[str, Any]:
+    """Return traits, purpose and every contextual interpretation for a stem."""
+    stem = ensure_stem(stem)
+    return _profiles()[stem]
+
+
+__all__ = ["get_stem_full_profile"]
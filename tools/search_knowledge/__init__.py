@@ -0,0 +1,164 @@
+"""Ranked concept search over the trait/profile/interpretation YAML resources."""
+
+from __future__ import annotations
+
+import functools
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterator, List, Tuple
+
+from ..common import STEM_TO_ELEMENT
+from ..data_loader import load_yaml_resource
+from ..get_branch_properties import RESOURCE_PATH as BRANCH_PROPERTIES_PATH
+from ..get_element_interpretation_contextual import RESOURCE_PATH as INTERPRETATION_PATH
+from ..get_element_profile import RESOURCE_PATH as ELEMENT_PROFILE_PATH
+from ..get_stem_purpose import RESOURCE_PATH as STEM_PURPOSE_PATH
+
+GANJI_TRAITS_PATH = "get_ganji_traits/ganji_traits"
+DEFAULT_LIMIT = 5
+MAX_LIMIT = 20
+
+# BM25 parameters; documents are short sentences so length normalisation is mild.
+_K1 = 1.2
+_B = 0.5
+
+# Anything that is not a Hangul syllable, Hanja, Latin letter or digit splits words.
+_WORD_SPLIT = re.compile(r"[^0-9A-Za-z가-힣一-鿿]+")
+
+
+def _ngrams(text: str) -> List[str]:
+    """Split text into character n-grams suited to Korean.
+
+    Korean attaches particles to nouns ("리더십과"), so whole-word matching
+    misses most hits. Words are broken into character bigrams instead; a
+    one-character word ("간", "木") is kept as a unigram.
+    """
+    grams: List[str] = []
+    for word in _WORD_SPLIT.split(text.lower()):
+        if not word:
+            continue
+        if len(word) == 1:
+            grams.append(word)
+            continue
+        grams.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def _iter_documents() -> Iterator[Dict[str, Any]]:
+    """Yield one searchable document per trait, keyword, recommendation or interpretation."""
+    traits = load_yaml_resource(GANJI_TRAITS_PATH)
+    for kind, list_key, code_key in (
+        ("stem", "stems_traits", "stem"),
+        ("branch", "branch_traits", "branch"),
+    ):
+        for item in traits.get(list_key, []):
+            for field, text in item.get("traits", {}).items():
+                yield {
+                    "source": "get_ganji_traits",
+                    "kind": kind,
+                    "code": item.get(code_key),
+                    "element": item.get("element"),
+                    "field": field,
+                    "text": text,
+                }
+
+    for item in load_yaml_resource(ELEMENT_PROFILE_PATH).get("profiles", []):
+        element = item.get("element")
+        base = {"source": "get_element_profile", "kind": "element", "code": element, "element": element}
+        if item.get("traits"):
+            yield {**base, "field": "traits", "text": item["traits"]}
+        for field in ("keywords", "recommends"):
+            for text in item.get(field, []):
+                yield {**base, "field": field, "text": text}
+
+    interpretations = load_yaml_resource(INTERPRETATION_PATH).get("interpretations", {})
+    for element, contexts in interpretations.items():
+        for context, text in contexts.items():
+            yield {
+                "source": "get_element_interpretation_contextual",
+                "kind": "element",
+                "code": element,
+                "element": element,
+                "field": context,
+                "text": text,
+            }
+
+    for item in load_yaml_resource(STEM_PURPOSE_PATH).get("stem_purpose", []):
+        stem = item.get("stem")
+        base = {"source": "get_stem_purpose", "kind": "stem", "code": stem, "element": STEM_TO_ELEMENT.get(stem)}
+        if item.get("purpose"):
+            yield {**base, "field": "purpose", "text": item["purpose"]}
+        for text in item.get("notes", []):
+            yield {**base, "field": "notes", "text": text}
+
+    for item in load_yaml_resource(BRANCH_PROPERTIES_PATH).get("branch_properties", []):
+        if item.get("notes"):
+            yield {
+                "source": "get_branch_properties",
+                "kind": "branch",
+                "code": item.get("branch"),
+                "element": item.get("element"),
+                "field": "notes",
+                "text": item["notes"],
+            }
+
+
+class _Index:
+    """Inverted index of n-gram postings with precomputed BM25 weights."""
+
+    def __init__(self, documents: List[Dict[str, Any]]) -> None:
+        self.documents = documents
+        postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        lengths: List[int] = []
+        for doc_id, doc in enumerate(documents):
+            # Subject labels (甲, 木, ...) are indexed so "木 리더십" favours 木 entries.
+            labels = [label for label in (doc["code"], doc["element"]) if label]
+            grams = _ngrams(doc["text"]) + labels
+            lengths.append(len(grams))
+            for gram, tf in Counter(grams).items():
+                postings[gram].append((doc_id, tf))
+
+        avg_len = sum(lengths) / len(lengths) if lengths else 0.0
+        total = len(documents)
+        # Fold idf and length normalisation into each posting so a query is only lookups and adds.
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        for gram, entries in postings.items():
+            idf = math.log(1 + (total - len(entries) + 0.5) / (len(entries) + 0.5))
+            weighted = []
+            for doc_id, tf in entries:
+                norm = _K1 * (1 - _B + _B * lengths[doc_id] / avg_len)
+                weighted.append((doc_id, idf * tf * (_K1 + 1) / (tf + norm)))
+            self.postings[gram] = weighted
+
+    def search(self, query: str, limit: int) -> Tuple[int, List[Tuple[int, float]]]:
+        scores: Dict[int, float] = defaultdict(float)
+        for gram in set(_ngrams(query)):
+            for doc_id, weight in self.postings.get(gram, ()):
+                scores[doc_id] += weight
+        ranked = sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))
+        return len(ranked), ranked[:limit]
+
+
+@functools.lru_cache(maxsize=1)
+def _build_index() -> _Index:
+    """Build the index once per process from the cached YAML resources."""
+    return _Index(list(_iter_documents()))
+
+
+def search_knowledge(query: str, limit: int | None = None) -> Dict[str, Any]:
+    """Return the trait/profile/interpretation entries that best match a concept query."""
+    query = query.strip()
+    if not query:
+        raise ValueError("query must not be empty")
+    limit = DEFAULT_LIMIT if limit is None else int(limit)
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+
+    index = _build_index()
+    total, ranked = index.search(query, limit)
+    results = [{**index.documents[doc_id], "score": round(score, 3)} for doc_id, score in ranked]
+    return {"query": query, "total_matches": total, "results": results}
+
+
+__all__ = ["search_knowledge"]
@@ -0,0 +1,147 @@
+"""Compile tools.json (with $include) into cached OpenAI and CrewAI tool bundles.
+
+The per-tool JSON spec files are the single source of tool schemas. A bundle is
+compiled once per distinct content: repeated lookups only stat the source files,
+and a changed file is re-read and re-compiled under its new content hash.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class ToolSpecBundle:
+    """Compiled tool specs; treat the contents as read-only since bundles are shared."""
+
+    digest: str
+    sources: Tuple[Path, ...]
+    openai_tools: List[Dict[str, Any]]
+
+    @functools.cached_property
+    def function_specs(self) -> Dict[str, Dict[str, Any]]:
+        return {entry["function"]["name"]: entry["function"] for entry in self.openai_tools}
+
+    @functools.cached_property
+    def crewai_args_models(self) -> Dict[str, type]:
+        """Pydantic argument models per tool, built on first access (requires pydantic)."""
+        return {name: _args_model(spec) for name, spec in self.function_specs.items()}
+
+
+_BUNDLES_BY_DIGEST: Dict[str, ToolSpecBundle] = {}
+# Resolved tools.json path -> (source file signatures, digest) for the stat-only fast path.
+Stamp = Tuple[Path, int, int]
+_LOOKUP: Dict[Path, Tuple[Tuple[Stamp, ...], str]] = {}
+_LOCK = threading.Lock()
+
+
+def _stamp(path: Path) -> Stamp:
+    stat = path.stat()
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _signature(paths: Tuple[Path, ...]) -> Tuple[Stamp, ...] | None:
+    try:
+        return tuple(_stamp(path) for path in paths)
+    except FileNotFoundError:
+        return None
+
+
+def _expand(path: Path, stack: Tuple[Path, ...], sources: Dict[Path, bytes], stamps: Dict[Path, Stamp]) -> List[Any]:
+    """Read a spec file and expand its $include entries, rejecting include cycles."""
+    if path in stack:
+        chain = " -> ".join(str(p) for p in stack + (path,))
+        raise ValueError(f"$include cycle detected: {chain}")
+    if path not in sources:
+        try:
+            # Stamp before reading: an edit landing mid-read then shows up as a change next time.
+            stamps[path] = _stamp(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Tool spec not found: {path}") from None
+        sources[path] = path.read_bytes()
+    parsed = json.loads(sources[path].decode("utf-8"))
+    return _expand_value(parsed, path, stack + (path,), sources, stamps)
+
+
+def _expand_value(
+    obj: Any, path: Path, stack: Tuple[Path, ...], sources: Dict[Path, bytes], stamps: Dict[Path, Stamp]
+) -> List[Any]:
+    if isinstance(obj, list):
+        expanded: List[Any] = []
+        for item in obj:
+            expanded.extend(_expand_value(item, path, stack, sources, stamps))
+        return expanded
+    if isinstance(obj, dict) and "$include" in obj:
+        return _expand((path.parent / obj["$include"]).resolve(), stack, sources, stamps)
+    return [obj]
+
+
+def _validate(tools: List[Any], root: Path) -> None:
+    seen = set()
+    for entry in tools:
+        function = entry.get("function") if isinstance(entry, dict) else None
+        if not isinstance(function, dict) or entry.get("type") != "function" or "name" not in function:
+            raise ValueError(f"{root}: every tool spec needs type 'function' and a function name")
+        if function["name"] in seen:
+            raise ValueError(f"{root}: duplicate tool name '{function['name']}'")
+        seen.add(function["name"])
+
+
+def compile_tool_specs(tools_path: str | Path = "tools.json") -> ToolSpecBundle:
+    """Return the compiled bundle for a tools.json file, compiling only when its sources changed."""
+    root = Path(tools_path).resolve()
+    with _LOCK:
+        cached = _LOOKUP.get(root)
+        if cached and _signature(tuple(p for p, _, _ in cached[0])) == cached[0]:
+            return _BUNDLES_BY_DIGEST[cached[1]]
+
+        sources: Dict[Path, bytes] = {}
+        stamps: Dict[Path, Stamp] = {}
+        tools = _expand(root, (), sources, stamps)
+        hasher = hashlib.sha256()
+        for path in sorted(sources):
+            hasher.update(str(path).encode("utf-8") + b"\0" + sources[path] + b"\0")
+        digest = hasher.hexdigest()
+
+        bundle = _BUNDLES_BY_DIGEST.get(digest)
+        if bundle is None:
+            _validate(tools, root)
+            bundle = ToolSpecBundle(digest=digest, sources=tuple(sorted(sources)), openai_tools=tools)
+            _BUNDLES_BY_DIGEST[digest] = bundle
+        _LOOKUP[root] = (tuple(stamps[path] for path in bundle.sources), digest)
+        return bundle
+
+
+def _pydantic_field(property_spec: Dict[str, Any], required: bool) -> Tuple[Any, Any]:
+    """Create a pydantic field tuple from an OpenAPI-style property spec."""
+    t: Any = str
+    if property_spec.get("type") in {"integer", "number"}:
+        t = int
+    enum = property_spec.get("enum")
+    if enum:
+        from typing import Literal
+
+        t = Literal[tuple(enum)]  # type: ignore[valid-type]
+    default = ... if required else None
+    return t, default
+
+
+def _args_model(spec: Dict[str, Any]) -> type:
+    from pydantic import create_model
+
+    params = spec.get("parameters", {}).get("properties", {})
+    required_fields = set(spec.get("parameters", {}).get("required", []))
+    model_fields = {
+        field_name: _pydantic_field(prop_spec, field_name in required_fields)
+        for field_name, prop_spec in params.items()
+    }
+    return create_model(f"{spec['name']}_Args", **model_fields)  # type: ignore[call-overload]
+
+
+__all__ = ["ToolSpecBundle", "compile_tool_specs"]
@@ -0,0 +1,149 @@
+"""Lightweight per-request span tracing exported as Chrome trace-event JSON.
+
+A request is wrapped in ``trace(name)``; only a sampled fraction of requests
+(``SAJU_TRACE_SAMPLE_RATE``, 0.0-1.0, default 0) actually record. Inside it,
+``span(name)`` blocks become complete ("X") events. Outside a sampled trace a span
+is a no-op, so instrumentation can stay in hot paths. Finished traces are written
+to ``SAJU_TRACE_DIR`` (default ``traces``) and open in chrome://tracing or Perfetto.
+
+Generators that may resume on another thread (e.g. Starlette streaming bodies) cannot
+keep a context variable set across ``yield``; they call ``begin_trace`` and wrap only
+their non-yielding blocks in ``use_trace``, then ``Trace.finish`` at the end.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+SAMPLE_RATE_ENV = "SAJU_TRACE_SAMPLE_RATE"
+TRACE_DIR_ENV = "SAJU_TRACE_DIR"
+
+_current: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("saju_trace", default=None)
+
+
+def now_us() -> float:
+    """Current time in the trace clock (microseconds), for spans added with Trace.add."""
+    return time.perf_counter_ns() / 1000
+
+
+class Trace:
+    """Spans recorded for one request."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.trace_id = uuid.uuid4().hex[:12]
+        self.events: List[Dict[str, Any]] = []
+        self.start_us = now_us()
+
+    def add(self, name: str, category: str, start_us: float, end_us: float, args: Dict[str, Any]) -> None:
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start_us,
+                "dur": end_us - start_us,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def finish(self, export: bool = True) -> None:
+        """Close the request span and, unless disabled, export the trace."""
+        self.add(self.name, "request", self.start_us, now_us(), {"trace_id": self.trace_id})
+        if export:
+            self.export()
+
+    def to_chrome(self) -> Dict[str, Any]:
+        return {
+            "traceEvents": sorted(self.events, key=lambda event: event["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"trace": self.name, "trace_id": self.trace_id},
+        }
+
+    def export(self, directory: str | Path | None = None) -> Path:
+        """Write the trace as Chrome trace-event JSON and return the file path."""
+        out_dir = Path(directory or os.environ.get(TRACE_DIR_ENV, "traces"))
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"{self.name}-{int(time.time())}-{self.trace_id}.json"
+        path.write_text(json.dumps(self.to_chrome(), ensure_ascii=False), encoding="utf-8")
+        return path
+
+
+def _sample_rate() -> float:
+    try:
+        return float(os.environ.get(SAMPLE_RATE_ENV, "0"))
+    except ValueError:
+        return 0.0
+
+
+@contextlib.contextmanager
+def trace(name: str, sample_rate: float | None = None, export: bool = True) -> Iterator[Optional[Trace]]:
+    """Trace one request; yields the Trace when sampled, otherwise None."""
+    rate = _sample_rate() if sample_rate is None else sample_rate
+    if _current.get() is not None or random.random() >= rate:
+        # Nested requests join the outer trace; unsampled requests record nothing.
+        with span(name, category="request"):
+            yield _current.get()
+        return
+
+    active = Trace(name)
+    token = _current.set(active)
+    try:
+        yield active
+    finally:
+        _current.reset(token)
+        active.finish(export)
+
+
+def current_trace() -> Optional[Trace]:
+    """Return the trace active in this context, to hand to work that may run on other threads."""
+    return _current.get()
+
+
+def begin_trace(name: str, sample_rate: float | None = None) -> Optional[Trace]:
+    """Start a trace without making it current; None when unsampled or already inside a trace."""
+    rate = _sample_rate() if sample_rate is None else sample_rate
+    if _current.get() is not None or random.random() >= rate:
+        return None
+    return Trace(name)
+
+
+@contextlib.contextmanager
+def use_trace(active: Optional[Trace]) -> Iterator[None]:
+    """Make ``active`` the current trace for a block; None leaves the current one in place."""
+    if active is None:
+        yield
+        return
+    token = _current.set(active)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def span(name: str, category: str = "app", **args: Any) -> Iterator[None]:
+    """Record a timed span in the active trace, if any."""
+    active = _current.get()
+    if active is None:
+        yield
+        return
+    start = now_us()
+    try:
+        yield
+    finally:
+        active.add(name, category, start, now_us(), args)
+
+
+__all__ = ["Trace", "begin_trace", "current_trace", "now_us", "span", "trace", "use_trace"]